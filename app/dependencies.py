@@ -2,6 +2,8 @@ import os
 
 
 APP_ENV = os.getenv("APP_ENV", "dev")
+# Comma separated frontend origins, no cross-origin access unless configured
+CORS_ORIGINS = [origin.strip() for origin in os.getenv("CORS_ORIGINS", "").split(",") if origin.strip()]
 
 DB_USER = os.getenv("DATABASE_USER")
 DB_NAME = os.getenv("DATABASE_NAME")
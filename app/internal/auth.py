@@ -1,7 +1,11 @@
+import hashlib
+import threading
+import time
 from typing import Annotated
 from datetime import datetime, timedelta, timezone
 
 import jwt
+from cachetools import TTLCache
 from fastapi import status
 from fastapi.exceptions import HTTPException
 from fastapi.params import Depends
@@ -9,18 +13,32 @@ from fastapi.security import OAuth2PasswordBearer
 from jwt import InvalidTokenError
 from pydantic import BaseModel
 
-from sqlmodel import select
-from sqlalchemy.exc import NoResultFound
+from sqlmodel import bindparam, select
 
 from pwdlib import PasswordHash
 from pwdlib.exceptions import UnknownHashError
+from pwdlib.hashers.argon2 import Argon2Hasher
 
 from ..dependencies import JWT_SECRET, JWT_ALGORITHM
 from .db import SessionDep
 from .models import User
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="login")
-password_hash = PasswordHash.recommended()
+# OWASP's argon2id baseline; existing hashes carry their own parameters and still verify
+password_hash = PasswordHash((Argon2Hasher(time_cost=2, memory_cost=19456, parallelism=1),))
+# Verified against for unknown emails so a miss costs the same as a wrong password
+_DUMMY_PASSWORD_HASH = password_hash.hash("nexus-iq-dummy-password")
+
+# Tokens are verified locally against the shared HMAC secret, never remotely.
+# Requiring "exp" keeps every accepted token short-lived.
+_JWT_ALGORITHMS = [JWT_ALGORITHM]
+_JWT_DECODE_OPTIONS = {"require": ["exp", "sub"]}
+
+# Resolved users by token digest, kept well below the token lifetime
+_token_cache: TTLCache[bytes, tuple[int, User]] = TTLCache(maxsize=10_000, ttl=30)
+_token_cache_lock = threading.Lock()
+
+_USER_BY_EMAIL = select(User).where(User.emailAddress == bindparam("email"))
 
 
 class Token(BaseModel):
@@ -42,14 +60,15 @@ def get_password_hash(password: str):
 
 def authenticate_user(emailAddress: str, password: str, session: SessionDep):
     try:
-        user = session.exec(select(User).where(User.emailAddress == emailAddress)).one()
+        user = session.exec(_USER_BY_EMAIL, params={"email": emailAddress}).first()
 
         if not user:
+            verify_password(password, _DUMMY_PASSWORD_HASH)
             return False
         if not verify_password(password, user.password):
             return False
         return user
-    except (NoResultFound, UnknownHashError):
+    except UnknownHashError:
         return False
 
 
@@ -66,7 +85,14 @@ def create_access_token(data: dict, expires_delta: timedelta | None = None):
     return encoded_jwt
 
 
-async def get_current_user(
+def forget_cached_user(user_id: int) -> None:
+    with _token_cache_lock:
+        for key, (_, user) in list(_token_cache.items()):
+            if user.id == user_id:
+                _token_cache.pop(key, None)
+
+
+def get_current_user(
     token: Annotated[str, Depends(oauth2_scheme)],
     session: SessionDep
 ):
@@ -76,8 +102,18 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"}
     )
 
+    cache_key = hashlib.sha256(token.encode()).digest()
+    with _token_cache_lock:
+        cached = _token_cache.get(cache_key)
+    if cached is not None:
+        expires_at, user = cached
+        if expires_at > time.time():
+            return user
+
     try:
-        payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
+        payload = jwt.decode(
+            token, JWT_SECRET, algorithms=_JWT_ALGORITHMS, options=_JWT_DECODE_OPTIONS
+        )
         emailAddress = payload.get("sub")
         if emailAddress is None:
             raise credentials_exception
@@ -87,12 +123,17 @@ async def get_current_user(
         raise credentials_exception
 
     user = session.exec(
-        select(User).where(User.emailAddress == token_data.emailAddress)
-    ).one()
+        _USER_BY_EMAIL, params={"email": token_data.emailAddress}
+    ).first()
 
     if user is None:
         raise credentials_exception
 
+    # Detach the user so commits in later requests can't expire the cached instance
+    session.expunge(user)
+    with _token_cache_lock:
+        _token_cache[cache_key] = (payload["exp"], user)
+
     return user
 
 
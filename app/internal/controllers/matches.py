@@ -1,17 +1,42 @@
+import threading
+
+from cachetools import TTLCache, cached
+from cachetools.keys import hashkey
+from sqlalchemy.orm import selectinload
 from sqlmodel import select
 
-from ..db import SessionDep
+from ..db import SessionDep, with_safe_loads
 from ..logging import get_logger
-from ..models import Summoner, Match, MatchParticipant, MatchTeam
+from ..models import Summoner, Match, MatchParticipant, MatchTeam, MatchesRead
 from ..riot_api import RiotAPIDep, RiotAPINotFoundError, RiotPlatform, REGION_TO_PLATFORM
 
 logger = get_logger(__name__)
 
+# Serialized recent matches per (puuid, region, match_count), absorbs frontend refreshes
+_recent_matches_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+_recent_matches_lock = threading.Lock()
+
+
+def forget_cached_matches(puuid: str) -> None:
+    with _recent_matches_lock:
+        for key in [key for key in _recent_matches_cache if key[0] == puuid]:
+            _recent_matches_cache.pop(key, None)
+
+
 def get_matches(puuid: str, platform: RiotPlatform, match_count: int, session: SessionDep):
-    statement = select(Match).join(MatchParticipant).join(MatchTeam).where(
-        MatchParticipant.summoner_puuid == puuid,
-        # Match.platform == platform.upper()
-    ).limit(match_count)
+    teams = selectinload(Match.teams)
+    team_participants = teams.selectinload(MatchTeam.participants)
+
+    statement = with_safe_loads(
+        select(Match).join(MatchParticipant).join(MatchTeam).where(
+            MatchParticipant.summoner_puuid == puuid,
+            # Match.platform == platform.upper()
+        ).limit(match_count),
+        teams.selectinload(MatchTeam.bans),
+        teams.selectinload(MatchTeam.objectives),
+        team_participants.selectinload(MatchParticipant.runes),
+        team_participants.joinedload(MatchParticipant.profile)
+    )
 
     results = session.exec(statement)
     matches = []
@@ -20,11 +45,20 @@ def get_matches(puuid: str, platform: RiotPlatform, match_count: int, session: S
 
     return matches
 
+
+@cached(
+    _recent_matches_cache,
+    key=lambda puuid, region, match_count, *_: hashkey(puuid, region, match_count),
+    lock=_recent_matches_lock
+)
 def get_recent_matches(
     puuid: str,
     region: str,
     match_count: int,
     session: SessionDep,
     riot_api: RiotAPIDep
-):
-    return get_matches(puuid, REGION_TO_PLATFORM[region], match_count, session)
\ No newline at end of file
+) -> list[MatchesRead]:
+    matches = get_matches(puuid, REGION_TO_PLATFORM[region], match_count, session)
+
+    # Cache detached read models rather than session-bound ORM instances
+    return [MatchesRead.model_validate(match, from_attributes=True) for match in matches]
@@ -1,56 +1,126 @@
-from typing import Any
+import asyncio
+from typing import Optional
 from datetime import datetime, timezone, timedelta
-from sqlmodel import select
+from cachetools import TTLCache
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import selectinload
+from sqlmodel import bindparam, func, select, update as sql_update
 
-from ..db import SessionDep
+from ..db import SessionDep, with_safe_loads
 from ..logging import get_logger
-from ..models import Summoner, SummonerLeagues, Match, MatchTeam, MatchTeamBans, MatchParticipant, \
+from .matches import forget_cached_matches
+from ..models import Summoner, SummonerLeagues, SummonerSearch, Match, MatchTeam, MatchTeamBans, MatchParticipant, \
     MatchParticipantRunes, MatchTeamObjectives
-from ..riot_api import RiotAPIDep, RiotAPINotFoundError, LeagueEntry
+from ..riot_api import RiotAPIDep, RiotAPINotFoundError, LeagueEntry, SummonerProfile
 from app.dependencies import SUMMONER_TTL_MINUTES
-from ..riot_api.models import MatchParticipantPerkStyle
-
-# from ..riot_api.summoners import RiotSummoners
+from ..riot_api.models import Match as RiotMatch, MatchParticipantPerkStyle
 
 logger = get_logger(__name__)
 
+_SUMMONER_TTL = timedelta(minutes=SUMMONER_TTL_MINUTES)
+# New matches are committed in groups instead of one transaction per match
+_MATCH_COMMIT_BATCH_SIZE = 25
+
+# Columns refreshed from the Riot profile on update
+_PROFILE_FIELDS = (
+    "summoner_name", "tag_line", "region", "summoner_level", "profile_icon", "revision_date"
+)
+
+# Serialized search results by lowercased Riot ID, fresh for as long as the summoner TTL
+_search_cache: TTLCache[str, SummonerSearch] = TTLCache(
+    maxsize=10_000, ttl=_SUMMONER_TTL.total_seconds()
+)
+# Searches currently being resolved, concurrent searches for the same Riot ID share one
+_inflight_searches: dict[str, asyncio.Future[Optional[SummonerSearch]]] = {}
+
+
+# Built once and executed with params=, the compiled form stays in the engine's cache
+_SUMMONER_BY_NAME = with_safe_loads(
+    select(Summoner).where(
+        func.lower(Summoner.summoner_name) == bindparam("game_name"),
+        func.lower(Summoner.tag_line) == bindparam("tag_line")
+    ),
+    selectinload(Summoner.leagues)
+)
+_SUMMONER_BY_PUUID = with_safe_loads(
+    select(Summoner).where(Summoner.puuid == bindparam("puuid")),
+    selectinload(Summoner.leagues)
+)
+_KNOWN_MATCH_IDS = select(Match.match_id).where(
+    Match.match_id.in_(bindparam("match_ids", expanding=True))
+)
+_KNOWN_PUUIDS = select(Summoner.puuid).where(
+    Summoner.puuid.in_(bindparam("puuids", expanding=True))
+)
+
 
 def get_summoner_by_name(
     game_name: str,
     tag_line: str,
     session: SessionDep
 ) -> Summoner:
-    statement = select(Summoner).where(
-        Summoner.summoner_name == game_name.strip(),
-        Summoner.tag_line == tag_line.strip()
-    )
+    return session.exec(_SUMMONER_BY_NAME, params={
+        "game_name": game_name.strip().lower(),
+        "tag_line": tag_line.strip().lower()
+    }).first()
 
-    return session.exec(statement).first()
 
+def get_known_match_ids(match_ids: list[str], session: SessionDep) -> set[str]:
+    return set(session.exec(_KNOWN_MATCH_IDS, params={"match_ids": match_ids}).all())
 
-def get_match_by_match_id(
-    match_id: str,
-    session: SessionDep
-) -> Match:
-    statement = select(Match).where(
-        Match.match_id == match_id
-    )
 
-    return session.exec(statement).first()
+def get_known_puuids(puuids: list[str], session: SessionDep) -> set[str]:
+    return set(session.exec(_KNOWN_PUUIDS, params={"puuids": puuids}).all())
 
 
 def get_summoner_by_puuid(puuid: str, session: SessionDep) -> Summoner:
-    statement = select(Summoner).where(Summoner.puuid == puuid)
+    return session.exec(_SUMMONER_BY_PUUID, params={"puuid": puuid}).first()
+
+
+def is_summoner_ttl_expired(summoner: Summoner, now: Optional[datetime] = None) -> bool:
+    age = (now or datetime.now(timezone.utc)) - summoner.updated_at
+    logger.debug("Summoner %s last updated %s ago, TTL is %s", summoner.puuid, age, _SUMMONER_TTL)
+
+    return age >= _SUMMONER_TTL
+
+
+def upsert(summoner: SummonerProfile, session: SessionDep) -> Summoner:
+    summoner_data = dict(
+        region=summoner.region,
+        summoner_name=summoner.summoner_name,
+        tag_line=summoner.tag_line,
+        summoner_level=summoner.summoner_level,
+        profile_icon=summoner.profile_icon,
+        revision_date=summoner.revision_date
+    )
+
+    # A known PUUID under a new Riot ID is a renamed summoner, update it in place.
+    # The ORM onupdate doesn't fire for this Core statement, so stamp updated_at here
+    statement = pg_insert(Summoner).values(
+        puuid=summoner.puuid, **summoner_data
+    ).on_conflict_do_update(
+        index_elements=[Summoner.puuid], set_={**summoner_data, "updated_at": func.now()}
+    ).returning(Summoner)
+
+    saved_summoner = session.exec(
+        statement, execution_options={"populate_existing": True}
+    ).scalar_one()
+
+    update_leagues(saved_summoner, summoner.leagues, session)
+
+    return saved_summoner
 
-    return session.exec(statement).first()
 
+def upsert_all(summoners: list[SummonerProfile], session: SessionDep) -> None:
+    for summoner in summoners:
+        upsert(summoner, session)
 
-def is_summoner_ttl_expired(summoner: Summoner) -> bool:
-    current_time = datetime.now(timezone.utc)
-    logger.info(f"Timedelta Results: {current_time - summoner.updated_at}, "
-                f"{timedelta(minutes=SUMMONER_TTL_MINUTES)}")
 
-    return current_time - summoner.updated_at >= timedelta(minutes=SUMMONER_TTL_MINUTES)
+def save(summoner: SummonerProfile, session: SessionDep) -> Summoner:
+    saved_summoner = upsert(summoner, session)
+    session.commit()
+
+    return saved_summoner
 
 
 async def create(
@@ -64,37 +134,7 @@ async def create(
     except RiotAPINotFoundError:
         return None
 
-    summoner_in_db = get_summoner_by_puuid(summoner.puuid, session)
-
-    if not summoner_in_db:
-        summoner_leagues = [SummonerLeagues(
-            league_id=league.league_id,
-            queue_type=league.queue_type,
-            tier=league.tier,
-            rank=league.rank,
-            wins=league.wins,
-            losses=league.losses,
-            league_points=league.league_points
-        ) for league in summoner.leagues]
-
-        new_summoner = Summoner(
-            puuid=summoner.puuid,
-            region=summoner.region,
-            summoner_name=summoner.summoner_name,
-            tag_line=summoner.tag_line,
-            summoner_level=summoner.summoner_level,
-            profile_icon=summoner.profile_icon,
-            revision_date=summoner.revision_date,
-            leagues=summoner_leagues
-        )
-
-        session.add(new_summoner)
-        session.commit()
-        session.refresh(new_summoner)
-
-        return new_summoner
-
-    return None
+    return await asyncio.to_thread(save, summoner, session)
 
 
 async def find_or_create(
@@ -103,19 +143,87 @@ async def find_or_create(
     session: SessionDep,
     riot_api: RiotAPIDep
 ):
-    summoner = get_summoner_by_name(game_name, tag_line, session)
+    summoner = await asyncio.to_thread(get_summoner_by_name, game_name, tag_line, session)
 
     if not summoner:
         summoner = await create(game_name, tag_line, session, riot_api)
 
     return summoner
 
+def _search_cache_key(game_name: str, tag_line: str) -> str:
+    return f"{game_name.strip().lower()}#{tag_line.strip().lower()}"
+
+
+def forget_cached_summoner(puuid: str) -> None:
+    for key, summoner in list(_search_cache.items()):
+        if summoner.puuid == puuid:
+            _search_cache.pop(key, None)
+
+
+async def search(
+    game_name: str,
+    tag_line: str,
+    session: SessionDep,
+    riot_api: RiotAPIDep
+) -> Optional[SummonerSearch]:
+    cache_key = _search_cache_key(game_name, tag_line)
+    cached = _search_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    inflight = _inflight_searches.get(cache_key)
+    if inflight is not None:
+        # Shielded so a follower's disconnect doesn't cancel the shared lookup
+        return await asyncio.shield(inflight)
+
+    future = asyncio.get_running_loop().create_future()
+    _inflight_searches[cache_key] = future
+
+    try:
+        summoner = await find_or_create(game_name, tag_line, session, riot_api)
+        result = SummonerSearch.model_validate(summoner, from_attributes=True) if summoner else None
+        future.set_result(result)
+    except Exception as e:
+        future.set_exception(e)
+        # Mark as retrieved, there may be no followers to consume it
+        future.exception()
+        raise
+    finally:
+        if not future.done():
+            future.cancel()
+        _inflight_searches.pop(cache_key, None)
+
+    if result is not None:
+        _search_cache[cache_key] = result
+
+    return result
+
+
 def update_leagues(
     summoner: Summoner,
     leagues: list[LeagueEntry],
     session: SessionDep
 ) -> None:
-    leagues_at_riot = [SummonerLeagues(
+    leagues_at_riot = {league.league_id: league for league in leagues}
+
+    for league in list(summoner.leagues):
+        league_at_riot = leagues_at_riot.pop(league.league_id, None)
+
+        # Delete old leagues
+        if league_at_riot is None:
+            # TODO: Determine if this is really useful (maybe needed for historic data?)
+            summoner.leagues.remove(league)
+            session.delete(league)
+            continue
+
+        league.tier = league_at_riot.tier
+        league.rank = league_at_riot.rank
+        league.wins = league_at_riot.wins
+        league.losses = league_at_riot.losses
+        league.league_points = league_at_riot.league_points
+
+    # Whatever is left is new, the flush batches these into one INSERT
+    summoner.leagues.extend(SummonerLeagues(
         league_id=league.league_id,
         queue_type=league.queue_type,
         tier=league.tier,
@@ -123,25 +231,7 @@ def update_leagues(
         wins=league.wins,
         losses=league.losses,
         league_points=league.league_points
-    ) for league in leagues]
-
-    for index, league in enumerate(summoner.leagues):
-        summoner_league = list(filter(lambda riot_league: riot_league.league_id == league.league_id, leagues_at_riot))
-
-        # Delete old leagues
-        if not summoner_league:
-            # TODO: Determine if this is really useful (maybe needed for historic data?)
-            session.delete(summoner.leagues[index])
-            summoner.leagues = leagues_at_riot
-        else:
-            summoner_league = summoner_league[0]
-            league.wins = summoner_league.wins
-            league.losses = summoner_league.losses
-            league.league_points = summoner_league.league_points
-
-            session.add(league)
-            session.commit()
-            print(summoner_league)
+    ) for league in leagues_at_riot.values())
 
 
 def get_participant_runes(style: str, perk_styles: list[MatchParticipantPerkStyle]) -> MatchParticipantPerkStyle:
@@ -151,120 +241,152 @@ def get_participant_runes(style: str, perk_styles: list[MatchParticipantPerkStyl
     ))[0]
 
 
+def build_match(match: RiotMatch) -> Match:
+    new_match = Match(
+        match_id=match.metadata.match_id,
+        platform=match.info.platform_id,
+        queue_id=match.info.queue_id,
+        game_mode=match.info.game_mode,
+        game_type=match.info.game_type,
+        game_version=match.info.game_version,
+        map_id=match.info.map_id,
+        game_start=match.info.game_creation_datetime,
+        game_end=match.info.game_end_datetime,
+        game_duration=match.info.game_duration,
+    )
+
+    # Create match teams
+    teams = {}
+    for team in match.info.teams:
+        teams[team.team_id] = MatchTeam(
+            match=new_match,
+            team_id=team.team_id,
+            bans=[MatchTeamBans(
+                champion_id=team_ban.champion_id,
+                pick_turn=team_ban.pick_turn
+            ) for team_ban in team.bans],
+            objectives=[MatchTeamObjectives(
+                objective=name,
+                first=objective.first,
+                kills=objective.kills
+            ) for name, objective in team.objectives],
+            win=team.win
+        )
+
+    # Save participants
+    for participant in match.info.participants:
+        # Create participants selected rune page
+        primary_style = get_participant_runes("primaryStyle", participant.perks.styles)
+        sub_style = get_participant_runes("subStyle", participant.perks.styles)
+
+        MatchParticipant(
+            match=new_match,
+            team=teams[participant.team_id],
+            summoner_puuid=participant.puuid,
+            champion_id=participant.champion_id,
+            champion_name=participant.champion_name,
+            lane=participant.lane,
+            kills=participant.kills,
+            deaths=participant.deaths,
+            assists=participant.assists,
+            double_kills=participant.double_kills,
+            triple_kills=participant.triple_kills,
+            quadra_kills=participant.quadra_kills,
+            penta_kills=participant.penta_kills,
+            largest_multi_kill=participant.largest_multi_kill,
+            damage_dealt_to_champions=participant.total_damage_dealt_to_champions,
+            damage_taken=participant.damage_taken,
+            total_minions_killed=participant.total_minions_killed,
+            neutral_minions_killed=participant.neutral_minions_killed,
+            gold_earned=participant.gold_earned,
+            vision_score=participant.vision_score,
+            wards_placed=participant.wards_placed,
+            wards_killed=participant.wards_killed,
+            vision_wards_bought=participant.vision_wards_bought,
+            item0=participant.item0,
+            item1=participant.item1,
+            item2=participant.item2,
+            item3=participant.item3,
+            item4=participant.item4,
+            item5=participant.item5,
+            item6=participant.item6,
+            runes=[MatchParticipantRunes(
+                primary_style=primary_style.style,
+                primary_perk0=primary_style.selections[0].perk,
+                primary_perk1=primary_style.selections[1].perk,
+                primary_perk2=primary_style.selections[2].perk,
+                primary_perk3=primary_style.selections[3].perk,
+                secondary_style=sub_style.style,
+                secondary_perk0=sub_style.selections[0].perk,
+                secondary_perk1=sub_style.selections[1].perk,
+                stat_perk_defense=participant.perks.stat_perks.defense,
+                stat_perk_flex=participant.perks.stat_perks.flex,
+                stat_perk_offense=participant.perks.stat_perks.offense
+            )]
+        )
+
+    return new_match
+
+
+async def ensure_participant_profiles(
+    match: RiotMatch,
+    session: SessionDep,
+    riot_api: RiotAPIDep,
+    semaphore: asyncio.Semaphore
+) -> bool:
+    puuids = [participant.puuid for participant in match.info.participants]
+    known_puuids = await asyncio.to_thread(get_known_puuids, puuids, session)
+    missing_puuids = [puuid for puuid in puuids if puuid not in known_puuids]
+    if not missing_puuids:
+        return True
+
+    # The match platform is the participants' region, so no region lookup is needed
+    profiles = await riot_api.get_summoner_profiles(
+        missing_puuids, match.info.platform_id.lower(), semaphore
+    )
+    if not all(profiles):
+        return False
+
+    await asyncio.to_thread(upsert_all, profiles, session)
+
+    return True
+
+
 async def update_matches(
     summoner: Summoner,
     match_count: int,
     session: SessionDep,
     riot_api: RiotAPIDep
 ):
-    recent_matches = await riot_api.get_recent_matches(summoner.puuid, summoner.region, match_count)
-
-    for match in recent_matches:
-        if not get_match_by_match_id(match.metadata.match_id, session):
-            new_match = Match(
-                match_id=match.metadata.match_id,
-                platform=match.info.platform_id,
-                queue_id=match.info.queue_id,
-                game_mode=match.info.game_mode,
-                game_type=match.info.game_type,
-                game_version=match.info.game_version,
-                map_id=match.info.map_id,
-                game_start=match.info.game_creation_datetime,
-                game_end=match.info.game_end_datetime,
-                game_duration=match.info.game_duration,
-            )
-            session.add(new_match)
-            session.commit()
-            session.refresh(new_match)
-
-            # Create match teams
-            team_ids = {
-                100: None,
-                200: None
-            }
-            for team in match.info.teams:
-                new_team = MatchTeam(
-                    match_id=new_match.id,
-                    team_id=team.team_id,
-                    bans=[MatchTeamBans(
-                        champion_id=team_ban.champion_id,
-                        pick_turn=team_ban.pick_turn
-                    ) for team_ban in team.bans],
-                    objectives=[MatchTeamObjectives(
-                        objective=name,
-                        first=objective.first,
-                        kills=objective.kills
-                    ) for name, objective in team.objectives],
-                    win=team.win
-                )
-
-                session.add(new_team)
-                session.commit()
-                session.refresh(new_team)
-                team_ids[team.team_id] = new_team.id
-
-
-
-            # Save participants
-            for participant in match.info.participants:
-                await find_or_create(participant.riot_id_game_name, participant.riot_id_tagline, session, riot_api)
-                new_participant = MatchParticipant(
-                    match_id=new_match.id,
-                    team_id=team_ids[participant.team_id],
-                    summoner_puuid=participant.puuid,
-                    champion_id=participant.champion_id,
-                    champion_name=participant.champion_name,
-                    lane=participant.lane,
-                    kills=participant.kills,
-                    deaths=participant.deaths,
-                    assists=participant.assists,
-                    double_kills=participant.double_kills,
-                    triple_kills=participant.triple_kills,
-                    quadra_kills=participant.quadra_kills,
-                    penta_kills=participant.penta_kills,
-                    largest_multi_kill=participant.largest_multi_kill,
-                    damage_dealt_to_champions=participant.damage_dealt_to_champions,
-                    damage_taken=participant.damage_taken,
-                    total_minions_killed=participant.total_minions_killed,
-                    neutral_minions_killed=participant.neutral_minions_killed,
-                    gold_earned=participant.gold_earned,
-                    vision_score=participant.vision_score,
-                    wards_placed=participant.wards_placed,
-                    wards_killed=participant.wards_killed,
-                    vision_wards_bought=participant.vision_wards_bought,
-                    item0=participant.item0,
-                    item1=participant.item1,
-                    item2=participant.item2,
-                    item3=participant.item3,
-                    item4=participant.item4,
-                    item5=participant.item5,
-                    item6=participant.item6,
-                )
-                session.add(new_participant)
-                session.commit()
-                session.refresh(new_participant)
-
-                # Create participants selected rune page
-                primary_style = get_participant_runes("primaryStyle", participant.perks.styles)
-                sub_style = get_participant_runes("subStyle", participant.perks.styles)
-
-                new_runes = MatchParticipantRunes(
-                    participant_id=new_participant.id,
-                    primary_style=primary_style.style,
-                    primary_perk0=primary_style.selections[0].perk,
-                    primary_perk1=primary_style.selections[1].perk,
-                    primary_perk2=primary_style.selections[2].perk,
-                    primary_perk3=primary_style.selections[3].perk,
-                    secondary_style=sub_style.style,
-                    secondary_perk0=sub_style.selections[0].perk,
-                    secondary_perk1=sub_style.selections[1].perk,
-                    stat_perk_defense=participant.perks.stat_perks.defense,
-                    stat_perk_flex=participant.perks.stat_perks.flex,
-                    stat_perk_offense=participant.perks.stat_perks.offense
-                )
-                session.add(new_runes)
-        else:
-            logger.debug(f"Match {match.metadata.match_id} already exist.")
+    match_ids = await riot_api.get_recent_match_ids(summoner.puuid, summoner.region, match_count)
+
+    # Only fetch details for matches we haven't stored yet
+    known_match_ids = await asyncio.to_thread(get_known_match_ids, match_ids, session)
+    new_match_ids = [match_id for match_id in match_ids if match_id not in known_match_ids]
+    logger.debug("Skipping %d stored matches, fetching %d", len(known_match_ids), len(new_match_ids))
+
+    # Matches are fetched concurrently, built as each one arrives and committed in batches.
+    # Profile lookups share the semaphore, so the whole sync stays within one request budget
+    semaphore = riot_api.request_semaphore()
+    pending = 0
+    async for match in riot_api.stream_matches(new_match_ids, summoner.region, semaphore):
+        if not await ensure_participant_profiles(match, session, riot_api, semaphore):
+            logger.warning("Skipping match %s, participant profiles unavailable", match.metadata.match_id)
+            continue
+
+        session.add(build_match(match))
+        pending += 1
+
+        if pending >= _MATCH_COMMIT_BATCH_SIZE:
+            await asyncio.to_thread(session.commit)
+            pending = 0
+
+    if pending:
+        await asyncio.to_thread(session.commit)
+
+
+def touch(summoner: Summoner, now: datetime, session: SessionDep) -> None:
+    session.exec(sql_update(Summoner).where(Summoner.id == summoner.id).values(updated_at=now))
     session.commit()
 
 
@@ -274,25 +396,55 @@ async def update(
     riot_api: RiotAPIDep,
     match_count: int
 ):
-    if is_summoner_ttl_expired(summoner):
+    now = datetime.now(tz=timezone.utc)
+
+    if is_summoner_ttl_expired(summoner, now):
         try:
-            summoner_at_riot = await riot_api.get_summoner_by_puuid(summoner.puuid)
+            summoner_info = await riot_api.get_summoner_info(summoner.puuid, summoner.region)
         except RiotAPINotFoundError:
             return None
 
-        summoner.summoner_name = summoner_at_riot.summoner_name
-        summoner.tag_line = summoner_at_riot.tag_line
-        summoner.region = summoner_at_riot.region
-        summoner.summoner_level = summoner_at_riot.summoner_level
-        summoner.profile_icon = summoner_at_riot.profile_icon
+        # Riot bumps revisionDate on profile changes and finished games, so an
+        # unchanged date means the profile and leagues are still current
+        revision_changed = summoner_info.revision_datetime != summoner.revision_date
+        if revision_changed:
+            riot_api.forget_summoner(summoner.puuid, summoner.region)
+            summoner_at_riot = await riot_api.get_summoner_by_puuid(
+                summoner.puuid, summoner.region, summoner_info
+            )
+            if not summoner_at_riot:
+                return None
+
+            changes = {
+                field: value
+                for field in _PROFILE_FIELDS
+                if getattr(summoner, field) != (value := getattr(summoner_at_riot, field))
+            }
+            for field, value in changes.items():
+                setattr(summoner, field, value)
+            # Set with the diff so whichever flush writes it (autoflush, a batch
+            # commit in update_matches) carries updated_at instead of expiring it
+            summoner.updated_at = now
+
+            if changes:
+                logger.info("Summoner %s changed: %s", summoner.puuid, ", ".join(changes))
 
-        update_leagues(summoner, summoner_at_riot.leagues, session)
+            update_leagues(summoner, summoner_at_riot.leagues, session)
+        else:
+            logger.debug("Summoner %s unchanged since last refresh", summoner.puuid)
+
+        # Always checked: stored profiles may lack matches (new or skipped ones,
+        # or a larger match_count) and this only costs an ID list and one query
         await update_matches(summoner, match_count, session, riot_api)
-        summoner.updated_at = datetime.now(tz=timezone.utc)
 
-        session.add(summoner)
-        session.commit()
-        session.refresh(summoner)
+        if session.dirty or session.new or session.deleted:
+            await asyncio.to_thread(session.commit)
+        elif not revision_changed:
+            # Nothing else to flush, restart the TTL without going through the unit of work
+            await asyncio.to_thread(touch, summoner, now, session)
+
+        forget_cached_summoner(summoner.puuid)
+        forget_cached_matches(summoner.puuid)
 
     return summoner
 
@@ -303,7 +455,7 @@ async def find_and_update(
     riot_api: RiotAPIDep,
     match_count: int
 ):
-    summoner = get_summoner_by_puuid(puuid, session)
+    summoner = await asyncio.to_thread(get_summoner_by_puuid, puuid, session)
 
     if not summoner:
         return None
@@ -1,28 +1,82 @@
+import hashlib
 from typing import Annotated
 
 from fastapi import Depends
+from sqlalchemy import Column, MetaData, String, Table, delete, insert, inspect, select
+from sqlalchemy.orm import raiseload
+from sqlalchemy.sql.base import ExecutableOption
 from sqlmodel import create_engine, Session, SQLModel
+from sqlmodel.sql.expression import SelectOfScalar
 
-from ..dependencies import DATABASE_URL
+from ..dependencies import APP_ENV, DATABASE_URL
 from .logging import get_logger
 from .models import User
 
 logger = get_logger(__name__)
 
 try:
-    engine = create_engine(DATABASE_URL)
+    # Above the default of 500 so compiled statements are not evicted and recompiled
+    engine = create_engine(DATABASE_URL, query_cache_size=1200)
 except Exception as err:
     print("Error", err)
 
 
+# Kept out of SQLModel.metadata so the marker never feeds into its own hash
+_schema_metadata = MetaData()
+_schema_version = Table(
+    "_schema_version",
+    _schema_metadata,
+    Column("hash", String(32), primary_key=True)
+)
+
+
+def _schema_hash() -> str:
+    layout = sorted(
+        (
+            table.name,
+            tuple((column.name, str(column.type)) for column in table.columns),
+            tuple(sorted(index.name for index in table.indexes))
+        )
+        for table in SQLModel.metadata.tables.values()
+    )
+    return hashlib.md5(repr(layout).encode()).hexdigest()
+
+
 def create_db_and_tables() -> None:
-    SQLModel.metadata.create_all(engine)
+    schema_hash = _schema_hash()
+
+    with engine.begin() as conn:
+        _schema_metadata.create_all(conn)
+        if conn.execute(select(_schema_version.c.hash)).scalar() == schema_hash:
+            logger.debug("Database schema unchanged, skipping table creation")
+            return
+
+        existing_tables = set(inspect(conn).get_table_names())
+        SQLModel.metadata.create_all(conn)
+
+        # create_all leaves existing tables alone, add indexes declared after they were created
+        for table in SQLModel.metadata.sorted_tables:
+            if table.name in existing_tables:
+                for index in table.indexes:
+                    index.create(conn, checkfirst=True)
+        conn.execute(delete(_schema_version))
+        conn.execute(insert(_schema_version).values(hash=schema_hash))
+
     logger.debug("Database tables created successfully")
 
 
 def get_session():
-    with Session(engine) as session:
+    # Objects stay readable after commit without a refresh SELECT per instance
+    with Session(engine, expire_on_commit=False) as session:
         yield session
 
 
 SessionDep = Annotated[Session, Depends(get_session)]
+
+
+def with_safe_loads(statement: SelectOfScalar, *loads: ExecutableOption) -> SelectOfScalar:
+    """Apply eager loads; in dev, any other relationship access raises instead of lazy loading."""
+    if APP_ENV == "dev":
+        return statement.options(*loads, raiseload("*"))
+
+    return statement.options(*loads)
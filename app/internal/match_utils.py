@@ -23,7 +23,7 @@ def extract_runes_from_participant(participant_data: dict) -> Optional[dict]:
     stat_perks = perks.get("statPerks", {})
 
     if not styles or len(styles) < 2:
-        logger.warning(f"Participant has invalid rune styles: {len(styles) if styles else 0} styles found")
+        logger.warning("Participant has invalid rune styles: %d styles found", len(styles) if styles else 0)
         return None
 
     primary_style = styles[0]
@@ -59,74 +59,15 @@ def extract_runes_from_participant(participant_data: dict) -> Optional[dict]:
     }
 
     if rune_data["primary_style"] == rune_data["secondary_style"]:
-        logger.warning(f"Invalid rune styles extracted: primary={rune_data['primary_style']}, secondary={rune_data["secondary_style"]}")
+        logger.warning(
+            "Invalid rune styles extracted: primary=%s, secondary=%s",
+            rune_data["primary_style"], rune_data["secondary_style"]
+        )
         return None
 
     return rune_data
 
 
-def create_match_participant_with_runes(
-        participant_data: dict,
-        match_id: str,
-        session: SessionDep
-) -> tuple:
-    from .models import Summoner, SummonerLeagues, MatchParticipant, MatchParticipantRunes
-
-    summoner = session.exec(
-        select(Summoner).where(or_(
-            Summoner.puuid == participant_data.get("puuid"),
-            Summoner.summoner_name == participant_data.get("riotIdGameName")
-            and Summoner.tag_line == participant_data.get("riotIdTagline")
-        ))
-    ).first()
-
-    if not summoner:
-        pass
-
-    participant = MatchParticipant(
-        match_id=match_id,
-        team_id=participant_data.get("teamId", 0),
-        summoner_puuid=participant_data.get("puuid", 0),
-        champion_id=participant_data.get("championId", 0),
-        champion_name=participant_data.get("championName", ""),
-        lane=participant_data.get("individualPosition", "UNKNOWN"),
-        kills=participant_data.get("kills", 0),
-        deaths=participant_data.get("deaths", 0),
-        assists=participant_data.get("assists", 0),
-        kill_participation=participant_data.get("challenges", {}).get("killParticipation", 0.0),
-        double_kills=participant_data.get("doubleKills", 0),
-        triple_kills=participant_data.get("tripleKills", 0),
-        quadra_kills=participant_data.get("quadraKills", 0),
-        penta_kills=participant_data.get("pentaKills", 0),
-        largest_multi_kill=participant_data.get("largestMultiKill", 0),
-        damage_dealt_to_champions=participant_data.get("totalDamageDealtToChampions", 0),
-        damage_taken=participant_data.get("totalDamageTaken", 0),
-        total_minions_killed=participant_data.get("totalMinionsKilled", 0),
-        neutral_minions_killed=participant_data.get("neutralMinionsKilled", 0),
-        gold_earned=participant_data.get("goldEarned", 0),
-        vision_score=participant_data.get("visionScore", 0),
-        wards_placed=participant_data.get("wardsPlaced", 0),
-        wards_killed=participant_data.get("wardsKilled", 0),
-        vision_wards_bought=participant_data.get("visionWardsBoughtInGame", 0),
-        item0=participant_data.get("item0", 0),
-        item1=participant_data.get("item1", 0),
-        item2=participant_data.get("item2", 0),
-        item3=participant_data.get("item3", 0),
-        item4=participant_data.get("item4", 0),
-        item5=participant_data.get("item5", 0),
-        item6=participant_data.get("item6", 0),
-    )
-
-    rune_data = extract_runes_from_participant(participant_data)
-    runes = None
-
-    if rune_data:
-        runes = MatchParticipantRunes(**rune_data)
-        participant.runes = [runes]
-
-    return participant, runes
-
-
 def find_or_create_summoner_by_puuid(participant_data: dict, session: SessionDep):
     puuid = participant_data.get("puuid")
     summoner = session.exec(
@@ -1,7 +1,7 @@
 from typing import Optional, Self, Any
 from datetime import datetime, timezone
 
-from sqlalchemy import DateTime, func, JSON
+from sqlalchemy import DateTime, func, Index, JSON
 from sqlmodel import Column, Field, Relationship, SQLModel
 from pydantic import BaseModel, computed_field
 
@@ -45,8 +45,8 @@ class Summoner(SQLModel, table=True):
     puuid: str = Field(index=True, unique=True, nullable=False, max_length=78, min_length=78)
     region: str = Field(nullable=False, min_length=2, max_length=4)
 
-    summoner_name: str = Field(index=True, nullable=False, max_length=64)
-    tag_line: str = Field(index=True, nullable=False, max_length=10)
+    summoner_name: str = Field(nullable=False, max_length=64)
+    tag_line: str = Field(nullable=False, max_length=10)
 
     summoner_level: int = Field(nullable=False)
     profile_icon: int = Field(nullable=False)
@@ -82,6 +82,14 @@ class Summoner(SQLModel, table=True):
         return f"{self.summoner_name}#{self.tag_line}"
 
 
+# Riot IDs are case-insensitive, searches compare on lower() and need a matching index
+Index(
+    "ix_summoners_name_tag_lower",
+    func.lower(Summoner.summoner_name),
+    func.lower(Summoner.tag_line)
+)
+
+
 class SummonerLeagues(SQLModel, table=True):
     __tablename__ = "summoner_leagues"
 
@@ -8,13 +8,13 @@ Usage:
 
     # With dependency injection (recommended)
     @router.get("/summoner/{name}/{tag}")
-    def get_summoner(name: str, tag: str, riot_api: RiotAPIDep):
-        return riot_api.get_summoner(name, tag)
+    async def get_summoner(name: str, tag: str, riot_api: RiotAPIDep):
+        return await riot_api.get_summoner(name, tag)
 
-    # Direct instantiation
+    # Direct instantiation (requests go through the shared aiohttp session)
     config = RiotAPIConfig(api_key="RGAPI-xxx")
-    with RiotAPIFacade(config) as riot_api:
-        summoner = riot_api.get_summoner("PlayerName", "TAG")
+    riot_api = RiotAPIFacade(config)
+    summoner = await riot_api.get_summoner("PlayerName", "TAG")
 """
 
 # Configuration
@@ -6,17 +6,15 @@ for all domain-specific clients.
 """
 
 from abc import ABC
-from typing import Self, Type, TypeVar, Union
-
-import os
+from functools import lru_cache
+from typing import MutableMapping, Optional, Self, Type, TypeVar, Union
 
 import aiohttp
-import requests.exceptions
-from aiohttp import ClientRequest, ClientHandlerType, ClientResponse, ClientTimeout, ClientSession
-from aiohttp.client_exceptions import ContentTypeError
-from fastapi import HTTPException
-from pydantic import BaseModel
+import orjson
+from aiohttp import ClientResponse
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
+from .cache import NOT_FOUND_CACHE
 from .config import RiotAPIConfig, RiotRegion, RiotPlatform
 from .exceptions import (
     RiotAPIError,
@@ -33,16 +31,11 @@ from ..logging import get_logger
 T = TypeVar("T", bound=BaseModel)
 
 
-async def retry_middleware(
-    req: ClientRequest,
-    handler: ClientHandlerType
-) -> ClientResponse:
-    for _ in range(3):
-        response = await handler(req)
-        if response.ok:
-            return response
+@lru_cache
+def _list_adapter(item_model: Type[T]) -> TypeAdapter[list[T]]:
+    """Build (once per model) an adapter validating a JSON list of items."""
+    return TypeAdapter(list[item_model])
 
-    return response
 
 class RiotAPIBase(ABC):
     """
@@ -54,23 +47,17 @@ class RiotAPIBase(ABC):
     Args:
         _config: Immutable configuration for API access.
         _logger: Logger instance for this client.
-        _session: aiohttp session with retry configuration.
+        _session: Shared aiohttp session (connection pool and auth header).
     """
 
     def __init__(self: Self, config: RiotAPIConfig) -> None:
         self._config = config
         self._logger = get_logger(self.__class__.__name__)
-        self._session = get_session()
 
-    def _create_session(self: Self) -> ClientSession:
-        headers = {"X-Riot-Token": os.getenv("RIOT_API_KEY")}
-        timeout = ClientTimeout(total=self._config.timeout_seconds)
-
-        return aiohttp.ClientSession(
-            headers=headers,
-            timeout=timeout,
-            middlewares=(retry_middleware,)
-        )
+    @property
+    def _session(self: Self) -> aiohttp.ClientSession:
+        """Shared aiohttp session, looked up on use so cached clients survive a lifespan restart."""
+        return get_session()
 
     def _build_url(
         self: Self,
@@ -94,7 +81,8 @@ class RiotAPIBase(ABC):
         self: Self,
         routing: Union[RiotRegion, RiotPlatform],
         path: str,
-        response_model: Union[Type[T], RiotError]
+        response_model: Union[Type[T], RiotError],
+        cache: Optional[MutableMapping[str, T]] = None
     ) -> T:
         """
         Make an HTTP GET request to the Riot API.
@@ -103,6 +91,7 @@ class RiotAPIBase(ABC):
             routing: Regional or platform routing value.
             path: API endpoint path.
             response_model: Pydantic model to parse response into
+            cache: Optional store of parsed responses keyed by URL.
 
         Returns:
             Parsed response as the specified model type.
@@ -116,6 +105,11 @@ class RiotAPIBase(ABC):
             RiotAPIError: For other errors.
         """
         url = self._build_url(routing, path)
+        if cache is not None:
+            self._check_not_found(url)
+            if url in cache:
+                return cache[url]
+
         self._logger.debug(f"Requesting: {url}")
 
         try:
@@ -126,13 +120,24 @@ class RiotAPIBase(ABC):
                 f"Request timed out after {self._config.timeout_seconds}s"
             )
 
-        return await self._handle_response(response, response_model)
+        try:
+            result = await self._handle_response(response, response_model)
+        except RiotAPINotFoundError:
+            if cache is not None:
+                NOT_FOUND_CACHE[url] = True
+            raise
+
+        if cache is not None:
+            cache[url] = result
+
+        return result
 
     async def _request_list(
         self: Self,
         routing: Union[RiotRegion, RiotPlatform],
         path: str,
         item_model: Type[T],
+        cache: Optional[MutableMapping[str, list[T]]] = None
     ) -> list[T]:
         """
         Make an HTTP GET request expecting a list response.
@@ -141,6 +146,7 @@ class RiotAPIBase(ABC):
             routing: Regional or platform routing value.
             path: API endpoint path.
             item_model: Pydantic model for list items.
+            cache: Optional store of parsed responses keyed by URL.
 
         Returns:
             List of parsed items.
@@ -149,6 +155,11 @@ class RiotAPIBase(ABC):
             Same exceptions as _request.
         """
         url = self._build_url(routing, path)
+        if cache is not None:
+            self._check_not_found(url)
+            if url in cache:
+                return cache[url]
+
         self._logger.debug(f"Requesting list: {url}")
 
         try:
@@ -158,15 +169,24 @@ class RiotAPIBase(ABC):
                 f"Request timed out after {self._config.timeout_seconds}s"
             )
 
-        self._check_response_status(response)
+        try:
+            body = await self._read_json(response)
+        except RiotAPINotFoundError:
+            if cache is not None:
+                NOT_FOUND_CACHE[url] = True
+            raise
 
         try:
-            data = await response.json()
-            return [item_model.model_validate(item) for item in data]
-        except (ContentTypeError, ValueError) as e:
+            result = _list_adapter(item_model).validate_json(body)
+        except ValidationError as e:
             self._logger.error(f"Failed to parse response: {e}")
             raise RiotAPIError(f"Invalid response format: {e}")
 
+        if cache is not None:
+            cache[url] = result
+
+        return result
+
     async def _request_raw_list(
         self: Self,
         routing: Union[RiotRegion, RiotPlatform],
@@ -202,15 +222,14 @@ class RiotAPIBase(ABC):
         except aiohttp.client_exceptions.ClientResponseError as e:
             raise RiotAPIError(f"Request failed: {e}")
 
-        self._check_response_status(response)
+        body = await self._read_json(response)
 
         try:
-            return await response.json()
-        except (ContentTypeError, ValueError) as e:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError as e:
             self._logger.error(f"Failed to parse response: {e}")
             raise RiotAPIError(f"Failed to parse response: {e}")
 
-
     async def _handle_response(
         self: Self,
         response: ClientResponse,
@@ -226,15 +245,72 @@ class RiotAPIBase(ABC):
         Returns:
             Parsed response as the specified model type.
         """
-        self._check_response_status(response)
+        body = await self._read_json(response)
 
         try:
-            data = await response.json()
-            return response_model.model_validate(data)
-        except (ContentTypeError, ValueError) as e:
+            return response_model.model_validate_json(body)
+        except ValidationError as e:
             self._logger.error(f"Failed to parse response: {e}")
             raise RiotAPIError(f"Invalid response format: {e}")
 
+    async def _read_json(
+        self: Self,
+        response: ClientResponse
+    ) -> bytes:
+        """
+        Check response status and content type, then read the raw body.
+
+        Non-JSON responses are rejected up front so the body is only
+        decoded once, directly by the model or orjson.
+
+        Args:
+            response: HTTP response object.
+
+        Returns:
+            Raw JSON response body.
+
+        Raises:
+            RiotAPIError: If the response is not JSON.
+            Same exceptions as _check_response_status.
+        """
+        self._check_response_status(response)
+
+        if response.content_type != "application/json":
+            self._logger.error(f"Unexpected content type: {response.content_type}")
+            raise RiotAPIError(f"Invalid response format: {response.content_type}")
+
+        return await response.read()
+
+    def _forget(
+        self: Self,
+        routing: Union[RiotRegion, RiotPlatform],
+        path: str,
+        cache: MutableMapping
+    ) -> None:
+        """
+        Drop a cached response so the next request fetches it again.
+
+        Args:
+            routing: Regional or platform routing value.
+            path: API endpoint path.
+            cache: Store the response was cached in.
+        """
+        cache.pop(self._build_url(routing, path), None)
+
+    def _check_not_found(self: Self, url: str) -> None:
+        """
+        Fail fast for URLs that recently answered 404.
+
+        Args:
+            url: Full request URL.
+
+        Raises:
+            RiotAPINotFoundError: If the URL is in the not-found cache.
+        """
+        if url in NOT_FOUND_CACHE:
+            self._logger.debug(f"Not found (cached): {url}")
+            raise RiotAPINotFoundError("Resource not found")
+
     def _check_response_status(
         self: Self,
         response: ClientResponse
@@ -287,62 +363,18 @@ class RiotAPIBase(ABC):
                 )
 
     async def close(self: Self) -> None:
-        """Close the HTTP session."""
-        await self._session.close()
+        """
+        Release client resources.
 
-    def __enter__(self: Self):
-        """Context manager entry."""
+        The aiohttp session is shared by every client and owned by the
+        application lifespan, so it is deliberately left open here.
+        """
+
+    async def __aenter__(self: Self):
+        """Async context manager entry."""
         return self
 
-    def __exit__(self: Self, exc_type, exc_val, exc_tb):
-        """Context manager exit - close session."""
-        self.close()
+    async def __aexit__(self: Self, exc_type, exc_val, exc_tb):
+        """Async context manager exit - release client resources."""
+        await self.close()
         return False
-
-"""
-    async def _send_request(self: Self, path: str):
-        async with aiohttp.ClientSession() as session:
-            headers = {"X-Riot-Token": os.getenv("RIOT_API_KEY")}
-            request = session.get(
-                url=f"{self._get_api_base()}{path}",
-                headers=headers
-            )
-
-            async with request as response:
-                try:
-                    if response.ok:
-                        return await response.json()
-                except ContentTypeError:
-                    raise HTTPException(status_code=500, detail="Internal Error")
-
-                match response.status:
-                    case 400:
-                        self._logger.error(f"Bad Request to {path}")
-                        raise HTTPException(status_code=400, detail="Bad Request")
-                    case 401:
-                        self._logger.error(f"Unauthorized Request to {path}")
-                        raise HTTPException(status_code=401, detail="Unauthorized")
-                    case 403:
-                        self._logger.error(f"Forbidden Request to {path}")
-                        raise HTTPException(status_code=403, detail="Forbidden")
-                    case 404:
-                        self._logger.error(f"Data not found at {path}")
-                        raise HTTPException(status_code=404, detail="Not Found")
-                    case 429:
-                        self._logger.warning(f"Rate limit exceeded at request to {path}")
-                        raise HTTPException(status_code=429, detail="Rate limit exceeded")
-                    case _:
-                        raise HTTPException(status_code=500, detail="Internal Server Error")
-
-    def _get_platform_or_region(self: Self):
-        return self._platform_or_region
-
-    def _set_platform_or_region(self: Self, platform_or_region):
-        self._platform_or_region = platform_or_region
-
-    def _get_api_base(self: Self) -> str:
-        api_base = self._api_base.replace("!!PLATFORM_OR_REGION!!",
-                                          self._get_platform_or_region())
-
-        return api_base
-"""
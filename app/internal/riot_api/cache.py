@@ -0,0 +1,24 @@
+"""
+In-process caches for Riot API responses.
+
+Each endpoint family gets its own store, sized and timed to how often
+its data changes. Parsed response models are cached by request URL.
+Match details are not cached: stored matches are never fetched again.
+"""
+
+from cachetools import TTLCache
+
+from .models import LeagueEntry, RiotAccount, AccountRegion
+
+
+# Accounts and active regions rarely change (Riot ID renames, region transfers)
+ACCOUNT_CACHE: TTLCache[str, RiotAccount | AccountRegion] = TTLCache(
+    maxsize=20_000, ttl=24 * 60 * 60
+)
+
+# League standings move after every ranked game
+LEAGUE_CACHE: TTLCache[str, list[LeagueEntry]] = TTLCache(maxsize=20_000, ttl=60)
+
+# URLs of cached endpoints that answered 404, so repeated bad lookups (e.g. a
+# misspelled Riot ID) don't spend rate limit quota until the entry expires
+NOT_FOUND_CACHE: TTLCache[str, bool] = TTLCache(maxsize=10_000, ttl=5 * 60)
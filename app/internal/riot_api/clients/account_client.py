@@ -9,6 +9,7 @@ from typing import Optional, Self
 
 from .. import RiotAPINotFoundError
 from ..base import RiotAPIBase
+from ..cache import ACCOUNT_CACHE
 from ..config import RiotAPIConfig, RiotRegion
 from ..models import RiotAccount, RiotError, AccountRegion
 from ..exceptions import RiotAPIValidationError
@@ -68,7 +69,7 @@ class AccountClient(RiotAPIBase):
         path = f"riot/account/v1/accounts/by-riot-id/{game_name}/{tag_line}"
 
 
-        return await self._request(routing, path, RiotAccount)
+        return await self._request(routing, path, RiotAccount, ACCOUNT_CACHE)
 
     async def get_by_puuid(
         self: Self,
@@ -94,7 +95,22 @@ class AccountClient(RiotAPIBase):
         routing = region or self._default_region
         path = f"riot/account/v1/accounts/by-puuid/{puuid}"
 
-        return await self._request(routing, path, RiotAccount)
+        return await self._request(routing, path, RiotAccount, ACCOUNT_CACHE)
+
+    def forget_puuid(
+        self: Self,
+        puuid: str,
+        region: Optional[RiotRegion] = None
+    ) -> None:
+        """
+        Drop the cached account information of a PUUID.
+
+        Args:
+            puuid: Player's universal unique identifier.
+            region: Regional routing the account was requested with.
+        """
+        routing = region or self._default_region
+        self._forget(routing, f"riot/account/v1/accounts/by-puuid/{puuid}", ACCOUNT_CACHE)
 
     async def get_active_region(
         self: Self,
@@ -122,7 +138,7 @@ class AccountClient(RiotAPIBase):
         routing = region or self._default_region
         path = f"riot/account/v1/region/by-game/{game}/by-puuid/{puuid}"
 
-        response = await self._request(routing, path, AccountRegion)
+        response = await self._request(routing, path, AccountRegion, ACCOUNT_CACHE)
         return response.region
 
     def _validate_riot_id(
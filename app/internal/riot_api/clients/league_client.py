@@ -8,6 +8,7 @@ Uses platform routing (na1, euw1, etc.).
 from typing import List
 
 from ..base import RiotAPIBase
+from ..cache import LEAGUE_CACHE
 from ..config import RiotPlatform, REGION_TO_PLATFORM
 from ..models import LeagueEntry
 from ..exceptions import RiotAPIValidationError
@@ -47,7 +48,7 @@ class LeagueClient(RiotAPIBase):
         self._validate_puuid(puuid)
 
         path = f"lol/league/v4/entries/by-puuid/{puuid}"
-        return await self._request_list(platform, path, LeagueEntry)
+        return await self._request_list(platform, path, LeagueEntry, LEAGUE_CACHE)
 
     async def get_entries_by_puuid_with_region(
         self,
@@ -72,6 +73,21 @@ class LeagueClient(RiotAPIBase):
         platform = self._region_to_platform(region)
         return await self.get_entries_by_puuid(puuid, platform)
 
+    def forget_entries_by_puuid_with_region(
+        self,
+        puuid: str,
+        region: str,
+    ) -> None:
+        """
+        Drop the cached league entries of a PUUID.
+
+        Args:
+            puuid: Player's universal unique identifier.
+            region: Region code (e.g., "na", "euw", "kr").
+        """
+        platform = self._region_to_platform(region)
+        self._forget(platform, f"lol/league/v4/entries/by-puuid/{puuid}", LEAGUE_CACHE)
+
     def _region_to_platform(self, region: str) -> RiotPlatform:
         """
         Convert a region code to platform routing value.
@@ -85,10 +101,10 @@ class LeagueClient(RiotAPIBase):
         Raises:
             RiotAPIValidationError: If region is unknown.
         """
-        region_lower = region.lower()
-        if region_lower not in REGION_TO_PLATFORM:
+        platform = REGION_TO_PLATFORM.get(region.lower())
+        if platform is None:
             raise RiotAPIValidationError(f"Unknown region: {region}")
-        return REGION_TO_PLATFORM[region_lower]
+        return platform
 
     def _validate_puuid(self, puuid: str) -> None:
         """
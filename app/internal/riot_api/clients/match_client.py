@@ -153,9 +153,10 @@ class MatchClient(RiotAPIBase):
         Raises:
             RiotAPIValidationError: If platform is unknown
         """
-        if platform not in PLATFORM_TO_REGION:
+        region = PLATFORM_TO_REGION.get(platform)
+        if region is None:
             raise RiotAPIValidationError(f"Unknown platform: {platform}")
-        return PLATFORM_TO_REGION[platform]
+        return region
 
     def _region_code_to_platform(self: Self, region: str) -> RiotPlatform:
         """
@@ -170,10 +171,10 @@ class MatchClient(RiotAPIBase):
         Raises:
             RiotAPIValidationError: If region code is unknown.
         """
-        region_lower = region.lower()
-        if region_lower not in REGION_TO_PLATFORM:
+        platform = REGION_TO_PLATFORM.get(region.lower())
+        if platform is None:
             raise RiotAPIValidationError(f"Unknown region: {region}")
-        return REGION_TO_PLATFORM[region_lower]
+        return platform
 
     def _validate_puuid(self: Self, puuid: str) -> None:
         """
@@ -86,10 +86,10 @@ class SummonerClient(RiotAPIBase):
         Raises:
             RiotAPIValidationError: If region is unknown.
         """
-        region_lower = region.lower()
-        if region_lower not in REGION_TO_PLATFORM:
+        platform = REGION_TO_PLATFORM.get(region.lower())
+        if platform is None:
             raise RiotAPIValidationError(f"Unknown region: {region}")
-        return REGION_TO_PLATFORM[region_lower]
+        return platform
 
     def _validate_puuid(self, puuid: str) -> None:
         """
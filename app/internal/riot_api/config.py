@@ -6,7 +6,8 @@ Provides immutable configuration, region/platform enums, and routing mappings.
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import FrozenSet
+from types import MappingProxyType
+from typing import FrozenSet, Mapping
 
 
 class RiotRegion(str, Enum):
@@ -37,8 +38,8 @@ class RiotPlatform(str, Enum):
     VN2 = "vn2"
 
 
-# Map region codes returned by Riot API to platform routing values
-REGION_TO_PLATFORM: dict[str, RiotPlatform] = {
+# Map region codes returned by Riot API to platform routing values (read-only)
+REGION_TO_PLATFORM: Mapping[str, RiotPlatform] = MappingProxyType({
     "br": RiotPlatform.BR1,
     "br1": RiotPlatform.BR1,
     "eun": RiotPlatform.EUN1,
@@ -71,10 +72,10 @@ REGION_TO_PLATFORM: dict[str, RiotPlatform] = {
     "tw2": RiotPlatform.TW2,
     "vn": RiotPlatform.VN2,
     "vn2": RiotPlatform.VN2,
-}
+})
 
-# Map platform to regional routing for match API
-PLATFORM_TO_REGION: dict[RiotPlatform, RiotRegion] = {
+# Map platform to regional routing for match API (read-only)
+PLATFORM_TO_REGION: Mapping[RiotPlatform, RiotRegion] = MappingProxyType({
     RiotPlatform.NA1: RiotRegion.AMERICAS,
     RiotPlatform.BR1: RiotRegion.AMERICAS,
     RiotPlatform.LA1: RiotRegion.AMERICAS,
@@ -91,7 +92,7 @@ PLATFORM_TO_REGION: dict[RiotPlatform, RiotRegion] = {
     RiotPlatform.EUW1: RiotRegion.EUROPE,
     RiotPlatform.TR1: RiotRegion.EUROPE,
     RiotPlatform.RU: RiotRegion.EUROPE,
-}
+})
 
 
 @dataclass(frozen=True)
@@ -107,6 +108,7 @@ class RiotAPIConfig:
         max_retries: Maximum number of retry attempts.
         retry_backoff_factor: Backoff multiplier for retries.
         retry_status_codes: HTTP status codes that trigger a retry.
+        max_concurrent_requests: Maximum number of concurrent match requests.
     """
     api_key: str
     base_url_template: str = "https://{routing}.api.riotgames.com"
@@ -117,3 +119,4 @@ class RiotAPIConfig:
     retry_status_codes: FrozenSet[int] = field(
         default_factory=lambda: frozenset({429, 500, 502, 503, 504})
     )
+    max_concurrent_requests: int = 10
@@ -31,74 +31,86 @@ def get_riot_api_config() -> RiotAPIConfig:
     return RiotAPIConfig(api_key=RIOT_API_KEY)
 
 
+@lru_cache
 def get_account_client(
     config: Annotated[RiotAPIConfig, Depends(get_riot_api_config)]
 ) -> AccountClient:
     """
-    Get AccountClient instance for dependency injection.
+    Get the shared AccountClient instance for dependency injection.
+
+    Cached like the configuration, so one client serves every request.
 
     Args:
         config: Injected configuration.
 
     Returns:
-        AccountClient instance.
+        Shared AccountClient instance.
     """
     return AccountClient(config)
 
 
+@lru_cache
 def get_summoner_client(
     config: Annotated[RiotAPIConfig, Depends(get_riot_api_config)]
 ) -> SummonerClient:
     """
-    Get SummonerClient instance for dependency injection.
+    Get the shared SummonerClient instance for dependency injection.
+
+    Cached like the configuration, so one client serves every request.
 
     Args:
         config: Injected configuration.
 
     Returns:
-        SummonerClient instance.
+        Shared SummonerClient instance.
     """
     return SummonerClient(config)
 
 
+@lru_cache
 def get_league_client(
     config: Annotated[RiotAPIConfig, Depends(get_riot_api_config)]
 ) -> LeagueClient:
     """
-    Get LeagueClient instance for dependency injection.
+    Get the shared LeagueClient instance for dependency injection.
+
+    Cached like the configuration, so one client serves every request.
 
     Args:
         config: Injected configuration.
 
     Returns:
-        LeagueClient instance.
+        Shared LeagueClient instance.
     """
     return LeagueClient(config)
 
 
+@lru_cache
 def get_riot_api(
     config: Annotated[RiotAPIConfig, Depends(get_riot_api_config)]
 ) -> RiotAPIFacade:
     """
-    Get RiotAPIFacade instance for dependency injection.
+    Get the shared RiotAPIFacade instance for dependency injection.
 
     This is the primary dependency for route handlers that need
-    to interact with the Riot API.
+    to interact with the Riot API. The facade and its clients are
+    created once per process; all of them send requests through the
+    application's pooled aiohttp session.
 
     Args:
         config: Injected configuration.
 
     Returns:
-        RiotAPIFacade instance.
+        Shared RiotAPIFacade instance.
 
     Example:
         @router.get("/summoner/{name}/{tag}")
-        def get_summoner(
+        async def get_summoner(
             name: str,
             tag: str,
             riot_api: RiotAPIDep,
         ):
-            return riot_api.get_summoner(name, tag)
+            return await riot_api.get_summoner(name, tag)
     """
     return RiotAPIFacade(config)
 
@@ -5,11 +5,12 @@ Composes domain clients to provide convenient methods for common use cases.
 This is the primary interface for application code to interact with the Riot API.
 """
 
-from typing import List, Optional, Self, Union
+import asyncio
+from typing import AsyncIterator, Awaitable, Callable, List, Optional, Self, TypeVar, Union
 
-from . import RiotAPINotFoundError
+from . import RiotAPINotFoundError, RiotAPIRateLimitError
 from .config import RiotAPIConfig, REGION_TO_PLATFORM
-from .models import RiotError, SummonerProfile, SummonerLeagueInfo, Match  # , Match, MatchTimeline
+from .models import RiotError, SummonerInfo, SummonerProfile, SummonerLeagueInfo, Match  # , Match, MatchTimeline
 from .clients.account_client import AccountClient
 from .clients.summoner_client import SummonerClient
 from .clients.league_client import LeagueClient
@@ -19,6 +20,8 @@ from ..logging import get_logger
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
 
 class RiotAPIFacade:
     """
@@ -29,9 +32,8 @@ class RiotAPIFacade:
 
     Example:
         config = RiotAPIConfig(api_key="RGAPI-xxx")
-        with RiotAPIFacade(config) as riot_api:
-            profile = riot_api.get_summoner("PlayerName", "TAG")
-            leagues = riot_api.get_summoner_leagues(profile.region, profile.puuid)
+        riot_api = RiotAPIFacade(config)
+        profile = await riot_api.get_summoner("PlayerName", "TAG")
     """
 
     def __init__(
@@ -97,14 +99,11 @@ class RiotAPIFacade:
         # Step 2: Get region for LoL
         region = await self._account_client.get_active_region("lol", account.puuid)
 
-        # Step 3: Get summoner profile from region-specific endpoint
-        summoner = await self._summoner_client.get_by_puuid_with_region(
-            account.puuid, region
-        )
-
-        # Step 4: Get summoner league entries
-        leagues = await self._league_client.get_entries_by_puuid_with_region(
-            account.puuid, region
+        # Step 3: Get summoner profile and league entries concurrently,
+        # both only depend on PUUID and region
+        summoner, leagues = await asyncio.gather(
+            self._summoner_client.get_by_puuid_with_region(account.puuid, region),
+            self._league_client.get_entries_by_puuid_with_region(account.puuid, region)
         )
 
         return SummonerProfile(
@@ -118,26 +117,81 @@ class RiotAPIFacade:
             leagues=leagues
         )
 
-    async def get_summoner_by_puuid(self: Self, puuid: str) -> Optional[SummonerProfile]:
+    async def get_summoner_by_puuid(
+        self: Self,
+        puuid: str,
+        region: Optional[str] = None,
+        summoner: Optional[SummonerInfo] = None,
+        semaphore: Optional[asyncio.Semaphore] = None
+    ) -> Optional[SummonerProfile]:
         """
         Get summoner profile by PUUID.
 
         Useful when you already have the PUUID and need to refresh data.
+        Passing the known region skips the region lookup and fetches the
+        account, summoner and league data in a single concurrent round.
 
         Args:
             puuid: Player's universal unique identifier.
+            region: Region code (e.g., "na", "euw", "kr"), looked up if omitted.
+            summoner: Summoner data already fetched for this region, reused
+                instead of requesting it again.
+            semaphore: Semaphore bounding concurrent requests. When given,
+                each underlying request takes a slot and is retried with
+                backoff when rate limited.
 
         Returns:
             Summoner profile or None if not found.
+
+        Raises:
+            RiotAPIRateLimitError: If rate limited (after all retries when
+                a semaphore is given).
         """
         logger.debug(f"Getting summoner by PUUID: {puuid[:8]}...")
 
+        def fetch_account():
+            return self._bounded(
+                f"account {puuid[:8]}...", semaphore,
+                lambda: self._account_client.get_by_puuid(puuid)
+            )
+
+        def fetch_summoner(region):
+            return self._bounded(
+                f"summoner {puuid[:8]}...", semaphore,
+                lambda: self._summoner_client.get_by_puuid_with_region(puuid, region)
+            )
+
+        def fetch_leagues(region):
+            return self._bounded(
+                f"leagues {puuid[:8]}...", semaphore,
+                lambda: self._league_client.get_entries_by_puuid_with_region(puuid, region)
+            )
+
         try:
-            # Get account info to get name/tag
-            account = await self._account_client.get_by_puuid(puuid)
-            region = await self._account_client.get_active_region("lol", puuid)
-            summoner = await self._summoner_client.get_by_puuid_with_region(puuid, region)
-            leagues = await self._league_client.get_entries_by_puuid_with_region(puuid, region)
+            if region is None:
+                # Account info (name/tag) and region only depend on the PUUID
+                account, region = await asyncio.gather(
+                    fetch_account(),
+                    self._bounded(
+                        f"region {puuid[:8]}...", semaphore,
+                        lambda: self._account_client.get_active_region("lol", puuid)
+                    )
+                )
+                summoner, leagues = await asyncio.gather(
+                    fetch_summoner(region),
+                    fetch_leagues(region)
+                )
+            elif summoner is not None:
+                account, leagues = await asyncio.gather(
+                    fetch_account(),
+                    fetch_leagues(region)
+                )
+            else:
+                account, summoner, leagues = await asyncio.gather(
+                    fetch_account(),
+                    fetch_summoner(region),
+                    fetch_leagues(region)
+                )
 
             return SummonerProfile(
                 puuid=puuid,
@@ -149,10 +203,80 @@ class RiotAPIFacade:
                 revision_date=summoner.revision_datetime,
                 leagues=leagues
             )
+        except RiotAPIRateLimitError:
+            # Let callers back off and retry instead of treating it as missing
+            raise
         except Exception as e:
             logger.warning(f"Failed to get summoner by PUUID: {e}")
             return None
 
+    async def get_summoner_profiles(
+        self: Self,
+        puuids: list[str],
+        region: str,
+        semaphore: Optional[asyncio.Semaphore] = None
+    ) -> list[Optional[SummonerProfile]]:
+        """
+        Get summoner profiles for several PUUIDs of one region concurrently.
+
+        Every underlying account, summoner and league request holds a
+        semaphore slot and is retried with backoff when rate limited, like
+        match requests.
+
+        Args:
+            puuids: Players' universal unique identifiers.
+            region: Region code (e.g., "na", "euw", "kr").
+            semaphore: Semaphore bounding concurrent requests, shared with
+                other requests of the same job (see request_semaphore).
+
+        Returns:
+            Summoner profiles in PUUID order, None for those not found.
+
+        Raises:
+            RiotAPIRateLimitError: If still rate limited after all retries.
+        """
+        semaphore = semaphore or self.request_semaphore()
+
+        return list(await asyncio.gather(*(
+            self.get_summoner_by_puuid(puuid, region, semaphore=semaphore)
+            for puuid in puuids
+        )))
+
+    def forget_summoner(self: Self, puuid: str, region: str) -> None:
+        """
+        Drop the cached account and league data of a summoner.
+
+        Call before refreshing a profile whose revision date changed, so
+        a Riot ID rename or new LP isn't answered from the cache.
+
+        Args:
+            puuid: Player's universal unique identifier.
+            region: Region code (e.g., "na", "euw", "kr").
+        """
+        self._account_client.forget_puuid(puuid)
+        self._league_client.forget_entries_by_puuid_with_region(puuid, region)
+
+    async def get_summoner_info(self: Self, puuid: str, region: str) -> SummonerInfo:
+        """
+        Get the summoner data of a player in a region.
+
+        Only queries the summoner endpoint, making its revision date a
+        cheap check of whether a stored profile needs a full refresh. The
+        result can be passed on to get_summoner_by_puuid.
+
+        Args:
+            puuid: Player's universal unique identifier.
+            region: Region code (e.g., "na", "euw", "kr").
+
+        Returns:
+            Summoner information, including the revision date.
+
+        Raises:
+            RiotAPINotFoundError: If summoner does not exist.
+            RiotAPIError: For other API errors.
+        """
+        return await self._summoner_client.get_by_puuid_with_region(puuid, region)
+
     # =========================================================================
     # League Methods
     # =========================================================================
@@ -202,7 +326,8 @@ class RiotAPIFacade:
         """
         Get recent match details for a player.
 
-        Fetches match IDs and then retrieves full match data for each.
+        Fetches match IDs and then retrieves full match data for each
+        concurrently, bounded by the configured request concurrency.
 
         Args:
             puuid: Player's universal unique identifier
@@ -210,20 +335,204 @@ class RiotAPIFacade:
             count: Number of matches to retrieve (max 100).
 
         Returns:
-            List of full match data objects.
+            List of full match data objects, in match ID order.
         """
         logger.debug(f"Getting {count} recent matches for PUUID: {puuid[:8]}...")
 
-        match_ids = await self._match_client.get_match_ids_by_puuid_with_region(puuid, region, count)
+        match_ids = await self.get_recent_match_ids(puuid, region, count)
+        semaphore = self.request_semaphore()
 
         # Get full match data for each matchId
+        results = await asyncio.gather(
+            *(self._get_match_with_backoff(match_id, region, semaphore) for match_id in match_ids),
+            return_exceptions=True
+        )
+
         matches = []
-        for match_id in match_ids:
-            try:
-                match = await self._match_client.get_match_with_region(match_id, region)
-                matches.append(match)
-            except Exception as e:
-                logger.warning(f"Failed to fetch match {match_id}: {e}")
+        for match_id, result in zip(match_ids, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to fetch match {match_id}: {result}")
                 continue
 
+            matches.append(result)
+
         return matches
+
+    async def get_recent_match_ids(
+        self: Self,
+        puuid: str,
+        region: str,
+        count: int = 10
+    ) -> list[str]:
+        """
+        Get recent match IDs for a player.
+
+        Args:
+            puuid: Player's universal unique identifier
+            region: Region code (e.g., "na", "euw", "kr").
+            count: Number of match IDs to retrieve (max 100).
+
+        Returns:
+            List of match IDs, most recent first.
+        """
+        return await self._match_client.get_match_ids_by_puuid_with_region(puuid, region, count)
+
+    async def stream_recent_matches(
+        self: Self,
+        puuid: str,
+        region: str,
+        count: int = 10
+    ) -> AsyncIterator[Match]:
+        """
+        Stream recent match details for a player as they arrive.
+
+        Args:
+            puuid: Player's universal unique identifier
+            region: Region code (e.g., "na", "euw", "kr").
+            count: Number of matches to retrieve (max 100).
+
+        Yields:
+            Full match data objects, in completion order.
+        """
+        logger.debug(f"Streaming {count} recent matches for PUUID: {puuid[:8]}...")
+
+        match_ids = await self.get_recent_match_ids(puuid, region, count)
+        async for match in self.stream_matches(match_ids, region):
+            yield match
+
+    def request_semaphore(self: Self) -> asyncio.Semaphore:
+        """
+        Create a semaphore bounding concurrent requests of one job.
+
+        Returns:
+            Semaphore allowing the configured request concurrency.
+        """
+        return asyncio.Semaphore(self._config.max_concurrent_requests)
+
+    async def stream_matches(
+        self: Self,
+        match_ids: list[str],
+        region: str,
+        semaphore: Optional[asyncio.Semaphore] = None
+    ) -> AsyncIterator[Match]:
+        """
+        Stream match details for the given match IDs as they arrive.
+
+        Requests run concurrently, bounded by the configured request
+        concurrency. Matches are yielded in completion order so callers
+        can start processing before all requests have finished. Matches
+        that fail to load are logged and skipped.
+
+        Args:
+            match_ids: Match IDs to fetch (e.g., ["EUW1_4567890123"]).
+            region: Region code (e.g., "na", "euw", "kr").
+            semaphore: Semaphore bounding concurrent requests, shared with
+                other requests of the same job (see request_semaphore).
+
+        Yields:
+            Full match data objects.
+        """
+        semaphore = semaphore or self.request_semaphore()
+
+        tasks = [
+            asyncio.ensure_future(self._get_match_with_backoff(match_id, region, semaphore))
+            for match_id in match_ids
+        ]
+
+        try:
+            for next_match in asyncio.as_completed(tasks):
+                try:
+                    yield await next_match
+                except Exception as e:
+                    logger.warning(f"Failed to fetch match: {e}")
+                    continue
+        finally:
+            # Don't leave requests running if the consumer stops early
+            for task in tasks:
+                task.cancel()
+
+    async def _get_match_with_backoff(
+        self: Self,
+        match_id: str,
+        region: str,
+        semaphore: asyncio.Semaphore
+    ) -> Match:
+        """
+        Get match data, waiting and retrying when rate limited.
+
+        Args:
+            match_id: Match ID (e.g., "EUW1_4567890123").
+            region: Region code (e.g., "na", "euw", "kr").
+            semaphore: Semaphore bounding concurrent requests.
+
+        Returns:
+            Full match data.
+
+        Raises:
+            RiotAPIRateLimitError: If still rate limited after all retries.
+            RiotAPIError: For other API errors.
+        """
+        return await self._with_backoff(
+            f"match {match_id}",
+            semaphore,
+            lambda: self._match_client.get_match_with_region(match_id, region)
+        )
+
+    def _bounded(
+        self: Self,
+        description: str,
+        semaphore: Optional[asyncio.Semaphore],
+        request: Callable[[], Awaitable[T]]
+    ) -> Awaitable[T]:
+        """
+        Run a request through _with_backoff, or directly without a semaphore.
+
+        Args:
+            description: What is being fetched, for logging.
+            semaphore: Semaphore bounding concurrent requests, if any.
+            request: Starts the request.
+
+        Returns:
+            Awaitable of the request's result.
+        """
+        if semaphore is None:
+            return request()
+
+        return self._with_backoff(description, semaphore, request)
+
+    async def _with_backoff(
+        self: Self,
+        description: str,
+        semaphore: asyncio.Semaphore,
+        request: Callable[[], Awaitable[T]]
+    ) -> T:
+        """
+        Run a request, waiting and retrying when rate limited.
+
+        The semaphore slot is released while waiting so other requests
+        can proceed once the rate limit window allows it.
+
+        Args:
+            description: What is being fetched, for logging.
+            semaphore: Semaphore bounding concurrent requests.
+            request: Starts the request, called once per attempt.
+
+        Returns:
+            The request's result.
+
+        Raises:
+            RiotAPIRateLimitError: If still rate limited after all retries.
+            RiotAPIError: For other API errors.
+        """
+        for attempt in range(self._config.max_retries + 1):
+            async with semaphore:
+                try:
+                    return await request()
+                except RiotAPIRateLimitError as e:
+                    if attempt == self._config.max_retries:
+                        raise
+
+                    delay = e.retry_after or self._config.retry_backoff_factor * 2 ** attempt
+
+            logger.warning(f"Rate limited fetching {description}, retrying in {delay}s")
+            await asyncio.sleep(delay)
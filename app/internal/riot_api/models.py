@@ -5,10 +5,16 @@ Provides type-safe models for parsing API responses and composite models
 for the facade layer.
 """
 
+import sys
 from datetime import datetime, timezone
-from typing import Any, Optional, Self
+from typing import Annotated, Any, Optional, Self
 
-from pydantic import BaseModel, Field, computed_field
+from pydantic import AfterValidator, BaseModel, Field, computed_field
+
+
+# Low-cardinality values (positions, queues, tiers, ...) repeat across every
+# participant and league entry, so share one str object per distinct value.
+InternedStr = Annotated[str, AfterValidator(sys.intern)]
 
 
 # =============================================================================
@@ -28,14 +34,14 @@ class RiotAccount(BaseModel):
     """Response model for account/v1 endpoints."""
     puuid: str
     game_name: str = Field(alias="gameName")
-    tag_line: str = Field(alias="tagLine")
+    tag_line: InternedStr = Field(alias="tagLine")
 
     model_config = {"populate_by_name": True}
 
 
 class AccountRegion(BaseModel):
     """Response model for region lookup endpoint."""
-    region: str
+    region: InternedStr
 
 
 # =============================================================================
@@ -67,9 +73,9 @@ class SummonerInfo(BaseModel):
 class LeagueEntry(BaseModel):
     """Response model for league/v4 entries."""
     league_id: str = Field(alias="leagueId")
-    queue_type: str = Field(alias="queueType")
-    tier: str
-    rank: str
+    queue_type: InternedStr = Field(alias="queueType")
+    tier: InternedStr
+    rank: InternedStr
     # summoner_id: str = Field(alias="summonerId")
     league_points: int = Field(alias="leaguePoints")
     wins: int
@@ -135,7 +141,7 @@ class MatchParticipant(BaseModel):
     riot_id_game_name: str = Field(alias="riotIdGameName")
     riot_id_tagline: str = Field(alias="riotIdTagline")
     champion_id: int = Field(alias="championId")
-    champion_name: str = Field(alias="championName")
+    champion_name: InternedStr = Field(alias="championName")
     champion_level: int = Field(alias="champLevel")
     time_played: int = Field(alias="timePlayed")
     team_id: int = Field(alias="teamId")
@@ -154,17 +160,16 @@ class MatchParticipant(BaseModel):
     largest_multi_kill: int = Field(alias="largestMultiKill")
 
     # Damage stats
-    damage_dealt_to_champions: int = Field(alias="totalDamageDealtToChampions")
+    total_damage_dealt_to_champions: int = Field(alias="totalDamageDealtToChampions")
     damage_taken: int = Field(alias="totalDamageTaken")
 
     # CS stats
     total_minions_killed: int = Field(alias="totalMinionsKilled")
     neutral_minions_killed: int = Field(alias="neutralMinionsKilled")
 
-    # Gold and damage
+    # Gold
     gold_earned: int = Field(alias="goldEarned")
     gold_spent: int = Field(alias="goldSpent")
-    total_damage_dealt_to_champions: int = Field(alias="totalDamageDealtToChampions")
 
     # Items (0-6)
     item0: int = 0
@@ -185,8 +190,8 @@ class MatchParticipant(BaseModel):
     vision_wards_bought: int = Field(0, alias="visionWardsBoughtInGame")
 
     # Position
-    team_position: str = Field("", alias="teamPosition")
-    lane: str
+    team_position: InternedStr = Field("", alias="teamPosition")
+    lane: InternedStr
 
     model_config = {"populate_by_name": True}
 
@@ -246,13 +251,13 @@ class MatchInfo(BaseModel):
     game_start_timestamp: int = Field(alias="gameStartTimestamp")
     game_end_timestamp: Optional[int] = Field(None, alias="gameEndTimestamp")
     game_id: int = Field(alias="gameId")
-    game_mode: str = Field(alias="gameMode")
+    game_mode: InternedStr = Field(alias="gameMode")
     game_name: str = Field(alias="gameName")
-    game_type: str = Field(alias="gameType")
+    game_type: InternedStr = Field(alias="gameType")
     game_version: str = Field(alias="gameVersion")
     map_id: int = Field(alias="mapId")
     queue_id: int = Field(alias="queueId")
-    platform_id: str = Field(alias="platformId")
+    platform_id: InternedStr = Field(alias="platformId")
     participants: list[MatchParticipant]
     teams: list[MatchTeam]
 
@@ -300,9 +305,9 @@ class SummonerProfile(BaseModel):
     Used by RiotAPIFacade.get_summoner() to return complete profile data.
     """
     puuid: str
-    region: str
+    region: InternedStr
     summoner_name: str
-    tag_line: str
+    tag_line: InternedStr
     summoner_level: int
     profile_icon: int
     leagues: list[LeagueEntry]
@@ -321,9 +326,9 @@ class SummonerLeagueInfo(BaseModel):
     Simplified version of LeagueEntry for the facade layer.
     """
     league_id: str
-    queue_type: str
-    tier: str
-    rank: str
+    queue_type: InternedStr
+    tier: InternedStr
+    rank: InternedStr
     wins: int
     losses: int
     league_points: int
@@ -1,14 +1,14 @@
-import os
 import logging
 from contextlib import asynccontextmanager
 
 import aiohttp
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from .internal.db import create_db_and_tables
 from .internal.logging import configure_logging
-from .dependencies import APP_ENV
+from .dependencies import APP_ENV, CORS_ORIGINS, RIOT_API_KEY
 from .internal.session import init_session, close_session
 from .routers import auth, matches, summoners, users
 
@@ -18,8 +18,15 @@ async def lifespan(app: FastAPI):
     log_level = logging.DEBUG if APP_ENV == "dev" else logging.INFO
 
     timeout = aiohttp.ClientTimeout(total=10)
-    headers = {"X-Riot-Token": os.getenv("RIOT_API_KEY")}
-    connector = aiohttp.TCPConnector(limit=100, ttl_dns_cache=300)
+    headers = {"X-Riot-Token": RIOT_API_KEY}
+    connector = aiohttp.TCPConnector(
+        limit=200,
+        limit_per_host=32,
+        use_dns_cache=True,
+        ttl_dns_cache=300,
+        keepalive_timeout=60,
+        enable_cleanup_closed=True
+    )
 
     await init_session(timeout=timeout, connector=connector, headers=headers)
 
@@ -34,7 +41,8 @@ async def lifespan(app: FastAPI):
 app = FastAPI(
     root_path="/api/v1",
     lifespan=lifespan,
-    redoc_url=None
+    redoc_url=None,
+    default_response_class=ORJSONResponse
 )
 
 app.include_router(auth.router)
@@ -42,13 +50,13 @@ app.include_router(summoners.router)
 app.include_router(matches.router)
 app.include_router(users.router)
 
-origins = ["*"]
-
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=origins,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=CORS_ORIGINS,
+    allow_methods=["GET", "POST", "PATCH", "DELETE"],
+    allow_headers=["authorization", "content-type"],
+    # Let browsers reuse a preflight for a day instead of one per request
+    max_age=86400,
 )
 
 
@@ -25,32 +25,35 @@ logger = get_logger(__name__)
 
 @router.post("/register", response_model=UserResponse)
 def register(user_in: UserSignUpRequest, session: SessionDep):
-    logger.info(f"Try to register User with email: {user_in.emailAddress}")
+    logger.info("Try to register User with email: %s", user_in.emailAddress)
     if user_in.password != user_in.password_confirm:
-        logger.warning(f"Passwords for User[{user_in.emailAddress}] do not match")
+        logger.warning("Passwords for User[%s] do not match", user_in.emailAddress)
         raise HTTPException(status_code=400, detail="Passwords do not match")
 
-    user_in.password = get_password_hash(user_in.password)
-    new_user = User(**user_in.model_dump())
+    new_user = User(
+        avatarName=user_in.avatarName,
+        emailAddress=user_in.emailAddress,
+        password=get_password_hash(user_in.password)
+    )
 
     try:
         session.add(new_user)
         session.commit()
         session.refresh(new_user)
     except IntegrityError:
-        logger.warning(f"User[{user_in.emailAddress}] already exists")
+        logger.warning("User[%s] already exists", user_in.emailAddress)
         raise HTTPException(status_code=400, detail="User already exists")
 
-    logger.info(f"User[{new_user.id}] created successfully")
+    logger.info("User[%s] created successfully", new_user.id)
     return new_user
 
 
 @router.post("/login")
-async def login(
+def login(
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
     session: SessionDep
 ) -> Token:
-    logger.info(f"Try to authenticate User: {form_data.username}")
+    logger.info("Try to authenticate User: %s", form_data.username)
     user = authenticate_user(form_data.username, form_data.password, session)
     if not user:
         logger.warning("Authentication error: Incorrect username or password")
@@ -65,5 +68,5 @@ async def login(
         data={"sub": user.emailAddress}, expires_delta=access_token_expires
     )
 
-    logger.info(f"Authentication was successful")
+    logger.info("Authentication was successful")
     return Token(access_token=access_token, token_type="bearer")
\ No newline at end of file
@@ -1,28 +1,16 @@
-from typing import Annotated, Any, Optional
-from datetime import datetime, timedelta, timezone
+from typing import Annotated
 
-from fastapi import Response, status
+from fastapi import status
 from fastapi.params import Depends
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.routing import APIRouter
 
-from sqlmodel import select, or_
-
-from .matches import process_match
-from ..dependencies import SUMMONER_TTL_MINUTES
 from ..internal.auth import get_current_active_user
 from ..internal.controllers import summoners as SummonersController
 from ..internal.logging import get_logger
 from ..internal.db import SessionDep
-from ..internal.models import Summoner, SummonerLeagues, SummonerSearch, User
-
-#from ..internal.riot_api.riot_api import RiotAPI
-from ..internal.riot_api import (
-    RiotAPIFacade,
-    RiotAPIDep,
-    RiotAPIError,
-    riot_exception_to_http,
-)
+from ..internal.models import SummonerSearch, User
+from ..internal.riot_api import RiotAPIDep, RiotAPIRateLimitError, riot_exception_to_http
 
 
 router = APIRouter(
@@ -41,14 +29,14 @@ async def get_summoner(
     riot_api: RiotAPIDep
 ):
     logger.info(
-        f"User[{current_user.id}] searching for Summoner \"{game_name}#{tag_line}\"")
+        "User[%s] searching for Summoner \"%s#%s\"", current_user.id, game_name, tag_line)
 
-    summoner = await SummonersController.find_or_create(
+    summoner = await SummonersController.search(
         game_name, tag_line, session, riot_api
     )
 
     if not summoner:
-        return JSONResponse(
+        return ORJSONResponse(
             content={"message": "Summoner not found"},
             status_code=status.HTTP_404_NOT_FOUND
         )
@@ -64,14 +52,17 @@ async def update_summoner(
     match_count: int = 20
 ):
     logger.info(
-        f"User[{current_user.id}] triggered an update for Summoner with PUUID \"{puuid}\"")
+        "User[%s] triggered an update for Summoner with PUUID \"%s\"", current_user.id, puuid)
 
-    summoner = await SummonersController.find_and_update(
-        puuid, session, riot_api, match_count
-    )
+    try:
+        summoner = await SummonersController.find_and_update(
+            puuid, session, riot_api, match_count
+        )
+    except RiotAPIRateLimitError as e:
+        raise riot_exception_to_http(e)
 
     if not summoner:
-        return JSONResponse(
+        return ORJSONResponse(
             content={"message": "Summoner not found"},
             status_code=status.HTTP_404_NOT_FOUND
         )
@@ -4,11 +4,12 @@ from fastapi.exceptions import HTTPException
 from fastapi.params import Depends
 from fastapi.param_functions import Query
 from fastapi.routing import APIRouter
+from pydantic import TypeAdapter
 
-from sqlmodel import select
+from sqlmodel import bindparam, delete, func, select
 
-from ..internal.auth import oauth2_scheme, get_current_active_user
-from ..internal.db import SessionDep
+from ..internal.auth import get_current_active_user, forget_cached_user
+from ..internal.db import SessionDep, with_safe_loads
 from ..internal.models import User, UserResponse
 
 
@@ -16,56 +17,71 @@ router = APIRouter(
     tags=["Users"]
 )
 
+users_adapter = TypeAdapter(list[UserResponse])
+
+_USER_BY_ID = with_safe_loads(select(User).where(User.id == bindparam("user_id")))
+
 
 # TODO: Add Role-Based Authorization Check
 @router.get("/users")
 def get_all_users(
-    token: Annotated[str, Depends(oauth2_scheme)],
     session: SessionDep,
     current_user: Annotated[User, Depends(get_current_active_user)],
-    offset: int = 0,
+    cursor: int | None = None,
     limit: Annotated[int, Query(le=100)] = 100
 ):
-    users = session.exec(select(User).offset(offset).limit(limit)).all()
+    # Total row count rides along as a scalar subquery, so one round-trip
+    # returns both the page and the total
+    total_count = select(func.count(User.id)).scalar_subquery()
+    statement = with_safe_loads(
+        select(User, total_count.label("total")).order_by(User.id).limit(limit)
+    )
+    if cursor is not None:
+        statement = statement.where(User.id > cursor)
+
+    rows = session.exec(statement).all()
+    users = [user for user, _ in rows]
+    total = rows[0].total if rows else session.exec(select(func.count(User.id))).one()
+
     return {
         "status": 200,
         "message": "Success",
-        "users": users
+        "users": users_adapter.validate_python(users, from_attributes=True),
+        "total": total,
+        "next_cursor": users[-1].id if users else None
     }
 
 
-@router.get("/users/me", response_model=UserResponse)
+@router.get("/users/me", response_model=None)
 async def get_me(current_user: Annotated[User, Depends(get_current_active_user)]):
-    return current_user
+    return UserResponse.model_validate(current_user, from_attributes=True)
 
 
-@router.get("/users/{user_id}", response_model=UserResponse)
+@router.get("/users/{user_id}", response_model=None)
 def get_user(
-    token: Annotated[str, Depends(oauth2_scheme)],
     user_id: int,
     current_user: Annotated[User, Depends(get_current_active_user)],
     session: SessionDep
 ):
-    user = session.get(User, user_id)
+    user = session.exec(_USER_BY_ID, params={"user_id": user_id}).first()
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
-    return user
+    return UserResponse.model_validate(user, from_attributes=True)
 
 
 @router.delete("/users/{user_id}")
 def delete_user(
-    token: Annotated[str, Depends(oauth2_scheme)],
     user_id: int,
     current_user: Annotated[User, Depends(get_current_active_user)],
     session: SessionDep
 ):
-    user = session.get(User, user_id)
-    if not user:
+    result = session.exec(delete(User).where(User.id == user_id))
+    if result.rowcount == 0:
         raise HTTPException(status_code=404, detail="User not found")
 
-    session.delete(user)
     session.commit()
+    forget_cached_user(user_id)
 
     return {
         "status": 200,
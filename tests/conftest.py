@@ -0,0 +1,5 @@
+import os
+
+# app.dependencies reads these at import time
+os.environ.setdefault("JWT_SECRET", "test-secret")
+os.environ.setdefault("JWT_EXPIRES_IN", "60")
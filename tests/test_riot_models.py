@@ -0,0 +1,10 @@
+from collections import Counter
+
+from app.internal.riot_api.models import MatchParticipant
+
+
+def test_match_participant_aliases_are_unique():
+    keys = Counter(field.alias or name for name, field in MatchParticipant.model_fields.items())
+    duplicates = [key for key, count in keys.items() if count > 1]
+
+    assert not duplicates, f"Fields share an alias: {duplicates}"